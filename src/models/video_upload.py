@@ -1,12 +1,12 @@
 import asyncio
+import bisect
+import functools
 import os
 import time
 import math
-import requests
 from datetime import datetime, timedelta, timezone
 from typing import ClassVar, Mapping, Optional, Sequence, Tuple
 
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from typing_extensions import Self
 
 from viam.module.module import Module
@@ -20,11 +20,43 @@ from viam.components.generic import Generic as GenericComponent
 from viam.components.camera import Camera
 from viam.utils import ValueTypes
 from viam.logging import getLogger
-from google.cloud import storage
-from google.oauth2 import service_account
 
 LOGGER = getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=None)
+def _rn(name: str) -> ResourceName:
+    """Memoized ResourceName for a generic component.
+
+    get_resource_name builds a new proto per call and reconfigure can
+    fire often on live machines; the name -> ResourceName mapping never
+    changes, so cache it.
+    """
+    return GenericComponent.get_resource_name(name)
+
+
+def _fmt(dt: datetime) -> str:
+    """Format a datetime as the video-store's 'YYYY-MM-DD_HH-MM-SSZ'.
+
+    Plain %-formatting of the integer fields skips strftime's locale
+    lookup and datetime->tm conversion.
+    """
+    return "%04d-%02d-%02d_%02d-%02d-%02dZ" % (
+        dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second
+    )
+
+
+def _to_epoch(s: str) -> float:
+    """Parse an ISO-8601 timestamp string to a UTC epoch float.
+
+    Rewrites a trailing 'Z' to '+00:00' so fromisoformat yields an
+    offset-aware datetime directly, skipping the extra datetime
+    allocation and tz conversion of an astimezone round-trip.
+    """
+    if s.endswith('Z'):
+        s = s[:-1] + '+00:00'
+    return datetime.fromisoformat(s).timestamp()
+
 class VideoUpload(GenericService, EasyResource):
     # To enable debug-level logging, either run viam-server with the --debug option,
     # or configure your resource/machine to display debug logs.
@@ -34,6 +66,14 @@ class VideoUpload(GenericService, EasyResource):
 
     BUFFER_SECONDS: ClassVar[int] = 30  # seconds to back off from 'now' for end timestamp
 
+    DEFAULT_MAX_PARALLEL_UPLOADS: ClassVar[int] = 8  # concurrent GCS uploads per cycle
+
+    # per-socket-read timeout for uploads; no total cap, so a slow but
+    # progressing transfer of a large MP4 never expires mid-flight
+    UPLOAD_SOCK_READ_TIMEOUT: ClassVar[int] = 60
+
+    STAGING_DIRNAME: ClassVar[str] = '.uploaded'  # holds uploaded files pending bulk delete
+
     @classmethod
     def new(
         cls, config: ComponentConfig, dependencies: Mapping[ResourceName, ResourceBase]
@@ -79,6 +119,9 @@ class VideoUpload(GenericService, EasyResource):
             for key in ('upload_path', 'path_to_service_account', 'google_cloud_path'):
                 if key not in fields:
                     raise ValueError(f"Missing config attribute '{key}' for gcp-project mode")
+            # 0 would build a semaphore no upload can ever acquire
+            if 'max_parallel_uploads' in fields and int(fields['max_parallel_uploads'].number_value) < 1:
+                raise ValueError("'max_parallel_uploads' must be a positive integer")
         # Return the video store as a required dependency
         # and no optional dependencies
         LOGGER.info(f"[{cls.__name__}] Configuration validated successfully.")
@@ -94,25 +137,44 @@ class VideoUpload(GenericService, EasyResource):
             dependencies (Mapping[ResourceName, ResourceBase]): Any dependencies (both required and optional)
         """
         LOGGER.info(f"[{self.name}] Reconfiguring module...")
-        # shut down any existing scheduler
-        if hasattr(self, 'scheduler') and self.scheduler:
-            self.scheduler.shutdown()
+        # stop any existing interval loop
+        if getattr(self, '_stop', None):
+            self._stop.set()
+        if getattr(self, '_interval_task', None):
+            self._interval_task.cancel()
 
         fields = config.attributes.fields
 
         # ─── Load game‐time schedule if present ────────────────────────────────────
-        if 'schedule' in fields:
-            raw = fields['schedule'].list_value.values
-            self.schedule = [
-                {
-                    'start': item.struct_value.fields['start'].string_value,
-                    'end':   item.struct_value.fields['end'].string_value,
-                }
-                for item in raw
-            ]
-        else:
-            self.schedule = []
-        LOGGER.info(f"[{self.name}] Loaded {len(self.schedule)} game windows")
+        raw = fields['schedule'].list_value.values if 'schedule' in fields else []
+
+        # single pass over the proto: grab each struct's field map once and
+        # convert straight to (start_ts, end_ts) epoch pairs, so each tick
+        # is a float compare instead of re-parsing ISO strings
+        def _window(item) -> Tuple[float, float]:
+            f = item.struct_value.fields
+            return (_to_epoch(f['start'].string_value), _to_epoch(f['end'].string_value))
+
+        parsed = sorted(_window(item) for item in raw)
+        # merge overlapping/adjacent windows into a canonical non-overlapping
+        # set, the precondition the bisect lookup in is_game_time relies on
+        merged: list[tuple[float, float]] = []
+        for start, end in parsed:
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        self._schedule_epoch = merged
+        # parallel arrays sorted by start, for bisect lookup in is_game_time
+        self._starts = [s for s, _ in self._schedule_epoch]
+        self._ends = [e for _, e in self._schedule_epoch]
+        # (next_boundary_ts, in_window): the game-time answer can't change
+        # before next_boundary_ts, so ticks before it are one float compare
+        self._cached_state: Tuple[float, bool] = (0.0, False)
+        LOGGER.info(
+            f"[{self.name}] Loaded {len(raw)} game windows "
+            f"({len(self._schedule_epoch)} after merging overlaps)"
+        )
 
         # common attributes
         self.upload_mode = fields['upload'].string_value
@@ -120,44 +182,118 @@ class VideoUpload(GenericService, EasyResource):
         LOGGER.info(f"[{self.name}] dependencies keys: {', '.join(str(k) for k in dependencies.keys())}")
         for k, v in dependencies.items():
             LOGGER.debug(f"[{self.name}]   {k!r} → {v!r}")
-        self.video_store = dependencies[GenericComponent.get_resource_name(vs_name)]
+        self.video_store = dependencies.get(_rn(vs_name))
+        if self.video_store is None:
+            raise KeyError(
+                f"video_store dependency '{vs_name}' not found; "
+                f"available: {', '.join(str(k) for k in dependencies)}"
+            )
         self.local_path = fields['upload_path'].string_value
         self.interval = int(fields['interval'].number_value)
 
         # GCP-specific setup
         if self.upload_mode == 'gcp-project':
-            if storage is None:
-                raise ImportError("google-cloud-storage not installed but required for gcp-project")
-
-            # load credentials from the service-account JSON
+            # imported lazily so viam-cloud mode doesn't pay the startup
+            # time and RSS of aiohttp/google-auth at module load
+            import aiohttp
+            from gcloud.aio.storage import Storage
+
+            # cap concurrent uploads so we don't open hundreds of TLS sessions
+            # at once; one shared connector keeps handshakes to ~max_parallel
+            if 'max_parallel_uploads' in fields:
+                self.max_parallel_uploads = int(fields['max_parallel_uploads'].number_value)
+            else:
+                self.max_parallel_uploads = self.DEFAULT_MAX_PARALLEL_UPLOADS
+
+            # reuse this instance's storage client (and its warm connection
+            # pool) across reconfigures unless the key file or concurrency
+            # limit changed; kept per-instance so tearing one resource down
+            # never closes a session a sibling instance is still using
             creds_path = fields['path_to_service_account'].string_value
-            creds = service_account.Credentials.from_service_account_file(creds_path)
-            client = storage.Client(credentials=creds, project=creds.project_id)
+            cache_key = (creds_path, os.stat(creds_path).st_mtime_ns, self.max_parallel_uploads)
+            if getattr(self, '_gcs_cache_key', None) != cache_key:
+                # close the replaced session, but only after any in-flight
+                # drain still uploading through it has finished
+                old_session = getattr(self, '_session', None)
+                old_drain = getattr(self, '_upload_task', None)
+                if old_session:
+                    async def _close_old(session=old_session, drain=old_drain):
+                        if drain and not drain.done():
+                            try:
+                                await drain
+                            except (asyncio.CancelledError, Exception):
+                                pass
+                        await session.close()
+                    try:
+                        asyncio.get_running_loop().create_task(_close_old())
+                    except RuntimeError:
+                        pass
+                connector = aiohttp.TCPConnector(
+                    limit=self.max_parallel_uploads,
+                    limit_per_host=self.max_parallel_uploads,
+                    ttl_dns_cache=300,
+                )
+                self._session = aiohttp.ClientSession(connector=connector)
+                # async storage client authenticated from the service-account JSON
+                self._aio_storage = Storage(service_file=creds_path, session=self._session)
+                self._sem = asyncio.Semaphore(self.max_parallel_uploads)
+                self._gcs_cache_key = cache_key
+            else:
+                LOGGER.info(f"[{self.name}] Reusing GCS client/session from previous configuration")
+
+            # gcloud-aio's default timeout=30 becomes ClientTimeout(total=30),
+            # a wall-clock cap on the whole PUT that any interval-length MP4
+            # over a slow uplink would blow through; cap idle reads instead
+            self._upload_timeout = aiohttp.ClientTimeout(
+                total=None, sock_read=self.UPLOAD_SOCK_READ_TIMEOUT
+            )
 
             # parse bucket name + optional prefix from google_cloud_path
             full_path = fields['google_cloud_path'].string_value.strip('/')
             parts = full_path.split('/', 1)
-            bucket_name = parts[0]
+            self.bucket_name = parts[0]
             self.cloud_prefix = parts[1] if len(parts) > 1 else ""
+            # destination names are prefix + fname; build the joined prefix
+            # once instead of formatting per file
+            self._dest_prefix = self.cloud_prefix + '/' if self.cloud_prefix else ''
 
-            self.bucket = client.bucket(bucket_name)
-            LOGGER.info(f"[{self.name}] GCS bucket initialized: {bucket_name}, prefix: '{self.cloud_prefix}'")
-
-        # schedule periodic upload cycles
-        self.scheduler = AsyncIOScheduler()
-        first_run = datetime.now(timezone.utc) + timedelta(minutes=self.interval)
-        self.scheduler.add_job(
-            self.upload_cycle,
-            trigger='interval',
-            minutes=self.interval,
-            id=f"{self.name}_interval_save",
-            next_run_time=first_run
-        )
-        self.scheduler.start()
-        LOGGER.info(f"[{self.name}] Scheduler started: first run at {first_run}")
+            LOGGER.info(f"[{self.name}] GCS bucket initialized: {self.bucket_name}, prefix: '{self.cloud_prefix}'")
+
+        # upload phase of the previous cycle, if still draining
+        self._upload_task: Optional[asyncio.Task] = getattr(self, '_upload_task', None)
+
+        # schedule periodic upload cycles on a plain asyncio task;
+        # APScheduler's job store and executor threads are overkill for a
+        # single fixed-interval job per resource
+        self._stop = asyncio.Event()
+        self._interval_task = asyncio.get_running_loop().create_task(self._interval_loop())
+        LOGGER.info(f"[{self.name}] Interval loop started: first run in {self.interval} minute(s)")
 
         return super().reconfigure(config, dependencies)
 
+    async def _interval_loop(self):
+        """Run `upload_cycle` every `interval` minutes until stopped.
+
+        Sleeps on the stop event with a timeout so close()/reconfigure
+        wake it immediately; fires missed by an overrunning cycle are
+        skipped rather than replayed.
+        """
+        period = self.interval * 60
+        next_fire = time.monotonic() + period
+        while not self._stop.is_set():
+            delay = next_fire - time.monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=delay)
+                    return
+                except asyncio.TimeoutError:
+                    pass
+            try:
+                await self.upload_cycle()
+            except Exception as e:
+                LOGGER.error(f"[{self.name}] Upload cycle failed: {e}", exc_info=True)
+            next_fire = max(next_fire + period, time.monotonic())
+
     async def save_video(self) -> None:
         LOGGER.info(f"[{self.name}] Invoking video-store save command")
         now = datetime.now(timezone.utc)
@@ -165,35 +301,104 @@ class VideoUpload(GenericService, EasyResource):
         start_time = end_time - timedelta(minutes=self.interval)
         command = {
             'command': 'save',
-            'from': start_time.strftime("%Y-%m-%d_%H-%M-%SZ"),
-            'to':   end_time.strftime("%Y-%m-%d_%H-%M-%SZ"),
+            'from': _fmt(start_time),
+            'to':   _fmt(end_time),
         }
         response = await self.video_store.do_command(command)
         LOGGER.info(f"[{self.name}] Save response: {response}")
 
-    def is_game_time(self, schedule: list[dict]) -> bool:
+    def _recompute_game_state(self, now: float) -> None:
+        """Rebuild the cached (next_boundary_ts, in_window) pair.
+
+        Windows are coalesced at reconfigure so they never overlap: the
+        only candidate is the last window whose start is <= now, found
+        by binary search. The next boundary is that window's end when
+        inside it, or the following window's start when outside.
+        """
+        i = bisect.bisect_right(self._starts, now) - 1
+        if i >= 0 and now <= self._ends[i]:
+            self._cached_state = (self._ends[i], True)
+        else:
+            nxt = i + 1
+            boundary = self._starts[nxt] if nxt < len(self._starts) else math.inf
+            self._cached_state = (boundary, False)
+
+    def is_game_time(self) -> bool:
         """
-        Given a list of {"start": iso‐string, "end": iso‐string} dicts,
-        return True if now (UTC) falls inside any of the windows.
+        Return True if now (UTC) falls inside any of the configured
+        schedule windows. Between boundaries this is a single float
+        compare against the cached next-boundary timestamp; the bisect
+        lookup only runs when a boundary has been crossed.
         """
-        now = datetime.now(timezone.utc)
-        for window in schedule:
-            start = datetime.fromisoformat(window["start"]).astimezone(timezone.utc)
-            end   = datetime.fromisoformat(window["end"]).astimezone(timezone.utc)
-            if start <= now <= end:
-                return True
-        return False
+        now = time.time()
+        if now >= self._cached_state[0]:
+            self._recompute_game_state(now)
+        return self._cached_state[1]
+
+    async def _list_existing(self) -> set:
+        """Return the names of objects already in the bucket under the
+        configured prefix, following pagination.
+
+        One list call per cycle replaces the per-object conditional-PUT
+        round trip, and collisions can be skipped before any bytes move.
+        """
+        existing: set = set()
+        params = {'fields': 'items/name,nextPageToken'}
+        if self.cloud_prefix:
+            params['prefix'] = self.cloud_prefix
+        while True:
+            resp = await self._aio_storage.list_objects(self.bucket_name, params=params)
+            existing.update(item['name'] for item in resp.get('items', []))
+            token = resp.get('nextPageToken')
+            if not token:
+                return existing
+            params['pageToken'] = token
+
+    @staticmethod
+    def _iter_mp4s(root: str):
+        """Yield paths of all .mp4 files under `root`, iteratively.
+
+        Uses os.scandir so directory type checks come from the cached
+        DirEntry instead of a stat per entry, and avoids os.walk's
+        per-level list allocations. Hidden directories (including the
+        `.uploaded` staging dir) are skipped.
+        """
+        stack = [root]
+        while stack:
+            d = stack.pop()
+            try:
+                it = os.scandir(d)
+            except FileNotFoundError:
+                # match os.walk: a missing/not-yet-created dir yields nothing
+                continue
+            with it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith('.'):
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.mp4'):
+                        yield entry.path
 
     async def upload_cycle(self):
         # if there's a schedule configured, bail out when we're not in a game window
-        if getattr(self, "schedule", None):
-            if not self.is_game_time(self.schedule):
+        if getattr(self, "_schedule_epoch", None):
+            if not self.is_game_time():
                 LOGGER.info(f"[{self.name}] Not game time, skipping save.")
                 return
             LOGGER.info(f"[{self.name}] Within game window, proceeding with save/upload.")
 
         LOGGER.info(f"[{self.name}] Upload cycle START")
 
+        # let the previous cycle's upload phase finish draining before
+        # starting another one; one interval is the backstop
+        if self._upload_task and not self._upload_task.done():
+            try:
+                await asyncio.wait_for(self._upload_task, timeout=self.interval * 60)
+            except asyncio.TimeoutError:
+                LOGGER.error(f"[{self.name}] Previous upload phase exceeded one interval, cancelled")
+            except Exception as e:
+                LOGGER.error(f"[{self.name}] Previous upload phase failed: {e}", exc_info=True)
+
         # Save video segments
         try:
             await self.save_video()
@@ -201,38 +406,120 @@ class VideoUpload(GenericService, EasyResource):
             LOGGER.error(f"[{self.name}] Save failed: {e}", exc_info=True)
             return
 
-        # If its a GCP upload, upload saved files to GCS
+        # If its a GCP upload, drain saved files to GCS as a background task
+        # so cycle N+1's save overlaps with cycle N's uploads
         if self.upload_mode == 'gcp-project':
-            # small delay to ensure files are flushed to disk
-            await asyncio.sleep(5)
+            self._upload_task = asyncio.create_task(self._drain_uploads())
 
-            for root, _, files in os.walk(self.local_path):
-                for fname in files:
-                    if not fname.endswith('.mp4'):
-                        continue
+        LOGGER.info(f"[{self.name}] Upload cycle END")
 
-                    src = os.path.join(root, fname)
-                    # construct destination path in bucket
-                    dest_blob = f"{self.cloud_prefix}/{fname}" if self.cloud_prefix else fname
-                    blob = self.bucket.blob(dest_blob)
+    async def _drain_uploads(self):
+        """Upload every saved MP4 under `local_path` to GCS, then remove
+        the local copies. Runs as a background task so the next cycle's
+        save doesn't wait on this cycle's uploads.
+        """
+        # errors are logged here rather than raised: the scheduler only
+        # awaits this task when it is still running at the next cycle, so
+        # an exception from a finished task would never be retrieved
+        try:
+            # poll briefly for saved segments to hit disk instead of a fixed
+            # 5s sleep; enumeration runs on a worker thread so slow disk
+            # stats (e.g. on a network-mounted upload directory) don't
+            # stall the event loop
+            paths: list[str] = []
+            for _ in range(10):
+                await asyncio.sleep(0.5)
+                paths = await asyncio.to_thread(lambda: list(self._iter_mp4s(self.local_path)))
+                if paths:
+                    break
+            if not paths:
+                LOGGER.info(f"[{self.name}] No MP4s found after save, skipping upload.")
+                return
 
-                    try:
-                        # precondition to avoid overwriting existing object
-                        blob.upload_from_filename(src, if_generation_match=0)
-                        os.remove(src)
-                        LOGGER.info(
-                            f"[{self.name}] Uploaded {fname} to gs://{self.bucket.name}/{dest_blob} "
-                            "and removed local copy"
+            # one listing up front instead of a conditional-request RTT per
+            # object; names that already exist are skipped outright rather
+            # than failing with a 412 every cycle
+            existing = await self._list_existing()
+
+            uploads = []
+            for src in paths:
+                fname = os.path.basename(src)
+                # construct destination path in bucket
+                dest_blob = self._dest_prefix + fname
+                if dest_blob in existing:
+                    LOGGER.warning(
+                        "[%s] gs://%s/%s already exists, skipping upload of %s",
+                        self.name, self.bucket_name, dest_blob, fname,
+                    )
+                    continue
+                uploads.append((src, fname, dest_blob))
+
+            # successful uploads are renamed into a staging dir (one cheap
+            # rename each) and bulk-unlinked at the end of the cycle; a crash
+            # mid-cycle leaves unfinished files in place to retry and finished
+            # ones clearly separated
+            staged = os.path.join(self.local_path, self.STAGING_DIRNAME)
+            await asyncio.to_thread(os.makedirs, staged, exist_ok=True)
+
+            # run uploads concurrently on the event loop, bounded by the
+            # semaphore. The rename stays inside the semaphore slot and on a
+            # worker thread so it overlaps with other uploads.
+            async def _bounded_upload(src: str, fname: str, dest_blob: str):
+                async with self._sem:
+                    # pass an open handle instead of the filename so aiohttp
+                    # streams the MP4 from disk in fixed chunks rather than
+                    # buffering the whole file; the library picks simple vs
+                    # resumable upload by size (retries re-send the full body
+                    # either way, so forcing resumable buys nothing)
+                    with open(src, 'rb') as f:
+                        await self._aio_storage.upload(
+                            self.bucket_name,
+                            dest_blob,
+                            f,
+                            timeout=self._upload_timeout,
                         )
-                    except Exception as e:
-                        LOGGER.error(f"[{self.name}] GCS upload error for {fname}: {e}", exc_info=True)
-
-        LOGGER.info(f"[{self.name}] Upload cycle END")
+                    await asyncio.to_thread(os.replace, src, os.path.join(staged, fname))
+
+            tasks = [_bounded_upload(*upload) for upload in uploads]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            for (src, fname, dest_blob), result in zip(uploads, results):
+                if isinstance(result, Exception):
+                    LOGGER.error("[%s] GCS upload error for %s: %s", self.name, fname, result, exc_info=result)
+                    continue
+                # %-style args defer formatting until the record is actually
+                # emitted, so disabled INFO logs cost nothing per file
+                LOGGER.info(
+                    "[%s] Uploaded %s to gs://%s/%s and staged local copy",
+                    self.name, fname, self.bucket_name, dest_blob,
+                )
+
+            # bulk-delete everything staged this cycle in one thread hop
+            def _purge(d: str):
+                for f in os.listdir(d):
+                    os.unlink(os.path.join(d, f))
+
+            await asyncio.to_thread(_purge, staged)
+        except Exception as e:
+            LOGGER.error("[%s] Upload drain failed: %s", self.name, e, exc_info=True)
 
     async def close(self):
         LOGGER.info(f"[{self.name}] Shutting down module")
-        if hasattr(self, 'scheduler') and self.scheduler:
-            self.scheduler.shutdown()
+        if getattr(self, '_stop', None):
+            self._stop.set()
+        if getattr(self, '_interval_task', None) and not self._interval_task.done():
+            self._interval_task.cancel()
+        if getattr(self, '_upload_task', None) and not self._upload_task.done():
+            # let the cancellation land before closing the session it uses
+            self._upload_task.cancel()
+            try:
+                await self._upload_task
+            except (asyncio.CancelledError, Exception):
+                pass
+        if getattr(self, '_aio_storage', None):
+            await self._aio_storage.close()
+        if getattr(self, '_session', None):
+            await self._session.close()
 
     async def do_command(
         self,